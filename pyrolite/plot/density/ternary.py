@@ -3,7 +3,7 @@ import numpy as np
 import matplotlib.tri
 from ...comp.codata import close, inverse_ILR, ILR, ALR, inverse_ALR
 from ...util.math import flattengrid
-from ...util.distributions import sample_kde
+from ...util.distributions import sample_kde, sample_kde_fft
 from ...util.plot.grid import bin_centres_to_edges
 from ...util.log import Handle
 
@@ -19,6 +19,7 @@ def ternary_heatmap(
     ternary_min_value=0.0001,  # 0.01%
     grid_border_frac=0.1,  # 110% range for grid
     grid=None,
+    fft=False,
     **kwargs
 ):
     """
@@ -46,6 +47,12 @@ def ternary_heatmap(
         Grid coordinates to sample at, if already calculated. For the density mode,
         this is a (nsamples, 2) array. For histograms, this is a two-member list of
         bin edges.
+    fft : :class:`bool`
+        Whether to approximate the density using linear binning and FFT convolution
+        over the grid (see :func:`~pyrolite.util.distributions.sample_kde_fft`),
+        which is substantially faster for large datasets and fine grids. This
+        requires the regular grid constructed here, and a :class:`ValueError` is
+        raised where :code:`grid` is also specified.
 
     Returns
     -------
@@ -62,6 +69,11 @@ def ternary_heatmap(
     Zeros will not render in this heatmap, consider replacing zeros with small values
     or imputing them if they must be incorporated.
     """
+    if fft and grid is not None:
+        msg = "FFT density estimates require the regular grid constructed here; "
+        msg += "`fft` cannot be used with a specified `grid`."
+        raise ValueError(msg)
+
     arr = close(data)  # should remove zeros/nans
     arr = arr[np.isfinite(arr).all(axis=1)]
 
@@ -123,8 +135,11 @@ def ternary_heatmap(
         tern_edge_grid = itfm(flattengrid(tfm_edgegrid))
 
     if mode == "density":
-        dgrid = grid or flattengrid(tfm_edgegrid)
-        H = sample_kde(tdata, dgrid)
+        if fft:
+            H = sample_kde_fft(tdata, tfm_edgegrid)
+        else:
+            dgrid = grid or flattengrid(tfm_edgegrid)
+            H = sample_kde(tdata, dgrid)
         H = H.reshape(tfm_edgegrid[0].shape)
         coords = tern_edge_grid
     elif "hist" in mode:
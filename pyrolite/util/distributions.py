@@ -1,5 +1,6 @@
 import numpy as np
 import scipy.stats
+import scipy.signal
 from functools import partial
 from ..util.math import flattengrid
 from ..comp.codata import ILR, close
@@ -30,6 +31,27 @@ def get_scaler(*fs):
     return partial(scaler, fs=fs)
 
 
+def _check_kde_data(data):
+    """
+    Check the shape of source data for a kernel density estimate, ensuring
+    observations are in rows.
+
+    Parameters
+    ------------
+    data : :class:`numpy.ndarray`
+        Source data for the kernel density estimate.
+
+    Returns
+    ----------
+    :class:`numpy.ndarray`
+    """
+    data = np.atleast_2d(data)
+    if data.shape[0] == 1:  # single row which should be a column
+        logger.debug("Transposing data row to column format for KDE.")
+        data = data.T
+    return data
+
+
 def sample_kde(data, samples, renorm=False, transform=lambda x: x, bw_method=None):
     """
     Sample a Kernel Density Estimate at points or a grid defined.
@@ -51,12 +73,7 @@ def sample_kde(data, samples, renorm=False, transform=lambda x: x, bw_method=Non
     ----------
     :class:`numpy.ndarray`
     """
-    # check shape info first
-    data = np.atleast_2d(data)
-    if data.shape[0] == 1:  # single row which should be a column
-        logger.debug("Transposing data row to column format for KDE.")
-        data = data.T
-
+    data = _check_kde_data(data)
     tdata = transform(data)
     tdata = tdata[np.isfinite(tdata).all(axis=1), :]  # filter rows with nans
 
@@ -86,6 +103,73 @@ def sample_kde(data, samples, renorm=False, transform=lambda x: x, bw_method=Non
     return zi
 
 
+def sample_kde_fft(data, samples, bw_method=None):
+    """
+    Approximate a bivariate Kernel Density Estimate over a regular grid, using
+    linear binning of the data onto the grid and FFT convolution with the kernel.
+    The kernel covariance is as for :func:`scipy.stats.gaussian_kde`.
+
+    Parameters
+    ------------
+    data : :class:`numpy.ndarray`
+        Source data to estimate the kernel density estimate; observations should be
+        in rows (:code:`npoints, 2`).
+    samples : :class:`list` of :class:`numpy.ndarray`
+        Meshgrid of evenly spaced coordinates to sample the KDE estimate at.
+    bw_method : :class:`str`, :class:`float`, callable
+        Method used to calculate the estimator bandwidth.
+        See :func:`scipy.stats.kde.gaussian_kde`.
+
+    Returns
+    ----------
+    :class:`numpy.ndarray`
+
+    Notes
+    ------
+    This scales with the size of the grid rather than the product of the number of
+    observations and grid points, but is an approximation to
+    :func:`sample_kde` which improves as the grid spacing decreases relative to the
+    kernel bandwidth. Observations outside of the grid are not counted.
+    """
+    data = _check_kde_data(data)
+    if data.shape[1] != 2:
+        msg = "FFT KDE requires bivariate data, got {} dimensions.".format(
+            data.shape[1]
+        )
+        raise ValueError(msg)
+    data = data[np.isfinite(data).all(axis=1), :]  # filter rows with nans
+    K = scipy.stats.gaussian_kde(data.T, bw_method=bw_method)
+
+    xs, ys = samples[0][0, :], samples[1][:, 0]
+    if min(xs.size, ys.size) < 2:
+        msg = "FFT KDE requires a grid with at least two nodes along each axis."
+        raise ValueError(msg)
+    shape = np.array([ys.size, xs.size])
+    step = np.array([ys[1] - ys[0], xs[1] - xs[0]])
+    # linear binning: split each observation between its four neighbouring nodes
+    pos = (data[:, ::-1] - np.array([ys[0], xs[0]])) / step
+    valid = ((pos >= 0) & (pos <= shape - 1)).all(axis=1)
+    pos = pos[valid]
+    idx = pos.astype(int)
+    frac = pos - idx
+    counts = np.zeros(shape + 1)  # padded to catch observations on the upper edge
+    for oy, wy in [(0, 1 - frac[:, 0]), (1, frac[:, 0])]:
+        for ox, wx in [(0, 1 - frac[:, 1]), (1, frac[:, 1])]:
+            flat = np.ravel_multi_index((idx[:, 0] + oy, idx[:, 1] + ox), shape + 1)
+            counts += np.bincount(flat, wy * wx, counts.size).reshape(counts.shape)
+    counts = counts[: shape[0], : shape[1]]
+
+    # kernel evaluated over all offsets between grid nodes
+    offsets = np.meshgrid(
+        *[np.arange(-(n - 1), n) * dx for n, dx in zip(shape[::-1], step[::-1])]
+    )
+    kernel = scipy.stats.multivariate_normal(np.zeros(2), K.covariance).pdf(
+        np.dstack(offsets)
+    )
+    zi = scipy.signal.fftconvolve(counts, kernel, mode="same") / data.shape[0]
+    return np.clip(zi, 0, None)  # remove negative rounding errors from the fft
+
+
 def sample_ternary_kde(data, samples, transform=ILR):
     """
     Sample a Kernel Density Estimate in ternary space points or a grid defined by
@@ -146,7 +146,8 @@ def flattengrid(grid):
     --------
     :class:`numpy.ndarray`
     """
-    return np.vstack([g.flatten() for g in grid]).T
+    # ravel avoids copying contiguous (e.g. meshgrid) arrays prior to stacking
+    return np.vstack([np.ravel(g) for g in grid]).T
 
 
 def linspc_(_min, _max, step=0.0, bins=20):
@@ -7,9 +7,9 @@ USE_PCOLOR : :class:`bool`
     Option to use the :func:`matplotlib.pyplot.pcolor` function in place
     of :func:`matplotlib.pyplot.pcolormesh`.
 """
+import warnings
 import numpy as np
 from numpy.linalg import LinAlgError
-import scipy.interpolate
 from scipy.stats.kde import gaussian_kde
 import matplotlib.pyplot as plt
 from ..meta import subkwargs
@@ -73,7 +73,8 @@ def percentile_contour_values_from_meshz(
     percentiles : :class:`numpy.ndarray`
         Percentile values for which to create contours.
     resolution : :class:`int`
-        Number of bins for thresholds between 0. and max(Z)
+        Deprecated and unused; thresholds are now taken directly from the sorted
+        values of Z rather than a linearly-spaced set of bins.
 
     Returns
     -------
@@ -82,30 +83,34 @@ def percentile_contour_values_from_meshz(
     contours : :class:`list`
         Contour height values.
 
-    Todo
+    Notes
     -----
-    This may error for a list of percentiles where one or more requested
-    values are below the miniumum threshold. The exception handling should
-    be updated to cater for arrays - where some of the values may be above
-    the minimum.
+    Where one or more of the requested percentiles corresponds to less than the
+    mass of the single highest point of Z, the contour cannot be resolved and the
+    minimum of Z (i.e. a contour around effectively all of the distribution) is
+    returned with the label :code:`"min"`.
     """
-    # Integral approach from https://stackoverflow.com/a/37932566
-    t = np.linspace(0.0, z.max(), resolution)
-    integral = ((z >= t[:, None, None]) * z).sum(axis=(1, 2))
-    f = scipy.interpolate.interp1d(integral, t)
-    try:
-        t_contours = f(np.array(percentiles) * z.sum())
-        return percentiles, t_contours
-    except ValueError:
+    if resolution != 1000:
+        warnings.warn(
+            "The `resolution` keyword argument is unused and will be removed.",
+            DeprecationWarning,
+        )
+    # Integral approach from https://stackoverflow.com/a/37932566, using the
+    # cumulative sum of the sorted values in place of a sweep over thresholds
+    zs = np.sort(z, axis=None)[::-1]
+    integral = np.cumsum(zs)
+    target = np.array(percentiles) * integral[-1]
+    if (target < integral[0]).any():
         # occurrs on the low-end of percentiles (high parts of distribution)
-        # maximum positions of distributions are limited by the resolution
-        # at some point there's a step down to zero
+        # where less than a single point of the distribution lies above the contour
         logger.debug(
-            "Percentile contour below minimum for given resolution"
-            "Returning Minimium."
+            "Percentile contour below the mass of the highest point of Z. "
+            "Returning minimum."
         )
-        non_one = integral[~np.isclose(integral, np.ones_like(integral))]
-        return ["min"], f(np.array([np.nanmax(non_one)]))
+        return ["min"], zs[-1:]
+    # interpolate thresholds between the sorted values of z
+    t_contours = np.interp(target, integral, zs)
+    return percentiles, t_contours
 
 
 def plot_Z_percentiles(
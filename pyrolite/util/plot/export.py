@@ -16,9 +16,7 @@ def save_figure(
     """
     Save a figure at a specified location in a number of formats.
     """
-    default_config = dict(bbox_inches="tight", transparent=True)
-    config = default_config.copy()
-    config.update(kwargs)
+    config = {**dict(bbox_inches="tight", transparent=True), **kwargs}
     for fmt in save_fmts:
         out_filename = os.path.join(str(save_at), name + "." + fmt)
         if output:
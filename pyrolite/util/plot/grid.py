@@ -19,14 +19,17 @@ def bin_centres_to_edges(centres, sort=True):
     ------
         * This can be updated to unevenly spaced bins, just need to calculate outer bins.
     """
+    centres = np.asarray(centres)
     if sort:
         centres = np.sort(centres.flatten())
-    internal_means = (centres[1:] + centres[:-1]) / 2.0
-    before, after = (
-        centres[0] - (internal_means[0] - centres[0]),
-        centres[-1] + (centres[-1] - internal_means[-1]),
-    )
-    return np.hstack([before, internal_means, after])
+    # fill a preallocated array in place, with internal means between the outer edges
+    edges = np.empty(centres.size + 1, dtype=np.result_type(centres, 0.5))
+    internal_means = edges[1:-1]
+    np.add(centres[1:], centres[:-1], out=internal_means)
+    internal_means /= 2.0
+    edges[0] = centres[0] - (internal_means[0] - centres[0])
+    edges[-1] = centres[-1] + (centres[-1] - internal_means[-1])
+    return edges
 
 
 def bin_edges_to_centres(edges):
@@ -34,12 +37,12 @@ def bin_edges_to_centres(edges):
     Translates edges of histogram bins to bin centres.
     """
     if edges.ndim == 1:
-        steps = (edges[1:] - edges[:-1]) / 2
-        return edges[:-1] + steps
+        lower, upper = edges[:-1], edges[1:]
     else:
-        steps = (edges[1:, 1:] - edges[:-1, :-1]) / 2
-        centres = edges[:-1, :-1] + steps
-        return centres
+        lower, upper = edges[:-1, :-1], edges[1:, 1:]
+    centres = np.add(lower, upper, dtype=np.result_type(edges, 0.5))
+    centres /= 2  # in place, avoiding further intermediate arrays
+    return centres
 
 
 def ternary_grid(
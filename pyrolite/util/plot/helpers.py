@@ -1,6 +1,7 @@
 """
 matplotlib helper functions for commong drawing tasks.
 """
+import functools
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches
@@ -8,7 +9,6 @@ import scipy.spatial
 from ..math import eigsorted, nancov
 from ..text import int_to_alpha
 from ..missing import cooccurence_pattern
-from .interpolation import interpolated_patch_path
 from .axes import add_colorbar, subaxes
 from ..log import Handle
 
@@ -123,9 +123,28 @@ def vector_to_line(
     """
     length = np.sqrt(variance)
     parts = np.linspace(-spans, spans, expand * spans + 1)
-    line = length * np.dot(parts[:, np.newaxis], vector[np.newaxis, :]) + mu
-    line = length * parts.reshape(parts.shape[0], 1) * vector + mu
-    return line
+    return (length * parts)[:, np.newaxis] * vector[np.newaxis, :] + mu
+
+
+@functools.lru_cache(maxsize=16)  # cache outputs for speed
+def _unit_circle(resolution=1000):
+    """
+    Points around a closed unit circle, used as a template for ellipses.
+
+    Parameters
+    -----------
+    resolution : :class:`int`
+        Number of points along the circle.
+
+    Returns
+    --------
+    :class:`numpy.ndarray`
+        Read-only array of points (:code:`resolution, 2`).
+    """
+    t = np.linspace(0, 2 * np.pi, resolution)
+    circle = np.column_stack([np.cos(t), np.sin(t)])
+    circle.setflags(write=False)  # shared between calls
+    return circle
 
 
 def plot_stdev_ellipses(
@@ -142,6 +161,8 @@ def plot_stdev_ellipses(
         Number of standard deviations from the mean for which to plot the ellipses.
     scale : :class:`float`
         Scale applying to all x-y data points. For intergration with python-ternary.
+    resolution : :class:`int`
+        Number of points along each ellipse.
     transform : :class:`callable`
         Function for transformation of data prior to plotting (to either 2D or 3D).
     ax : :class:`matplotlib.axes.Axes`
@@ -153,7 +174,11 @@ def plot_stdev_ellipses(
     """
     mean, cov = np.nanmean(comp, axis=0), nancov(comp)
     vals, vecs = eigsorted(cov)
-    theta = np.degrees(np.arctan2(*vecs[::-1]))
+    theta = np.arctan2(*vecs[::-1])[0]
+    rotation = np.array(
+        [[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]]
+    )
+    circle = _unit_circle(resolution)
 
     if ax is None:
         projection = None
@@ -166,10 +191,8 @@ def plot_stdev_ellipses(
     for nstd in np.arange(1, nstds + 1)[::-1]:  # backwards for svg construction
         # here we use the absolute eigenvalues
         xsig, ysig = nstd * np.sqrt(np.abs(vals))  # n sigmas
-        ell = matplotlib.patches.Ellipse(
-            xy=mean.flatten(), width=2 * xsig, height=2 * ysig, angle=theta[:1]
-        )
-        points = interpolated_patch_path(ell, resolution=resolution).vertices
+        # scale the unit circle, then rotate and translate to the mean
+        points = (circle * np.array([xsig, ysig])) @ rotation.T + mean.flatten()
 
         if callable(transform) and (transform is not None):
             points = transform(points)  # transform to compositional data
@@ -322,10 +345,10 @@ def nan_scatter(xdata, ydata, ax=None, axes_width=0.2, **kwargs):
     nanxdata = xdata[(np.isnan(ydata) & np.isfinite(xdata))]
     nanydata = ydata[(np.isnan(xdata) & np.isfinite(ydata))]
 
-    # yminmax = np.nanmin(ydata), np.nanmax(ydata)
+    ymin, ymax = np.nanmin(ydata), np.nanmax(ydata)
     no_ybins = 50
-    ybinwidth = (np.nanmax(ydata) - np.nanmin(ydata)) / no_ybins
-    ybins = np.linspace(np.nanmin(ydata), np.nanmax(ydata) + ybinwidth, no_ybins)
+    ybinwidth = (ymax - ymin) / no_ybins
+    ybins = np.linspace(ymin, ymax + ybinwidth, no_ybins)
 
     nanaxy.hist(nanydata, bins=ybins, orientation="horizontal", **kwargs)
     nanaxy.scatter(
@@ -335,10 +358,10 @@ def nan_scatter(xdata, ydata, ax=None, axes_width=0.2, **kwargs):
         **kwargs
     )
 
-    # xminmax = np.nanmin(xdata), np.nanmax(xdata)
+    xmin, xmax = np.nanmin(xdata), np.nanmax(xdata)
     no_xbins = 50
-    xbinwidth = (np.nanmax(xdata) - np.nanmin(xdata)) / no_xbins
-    xbins = np.linspace(np.nanmin(xdata), np.nanmax(xdata) + xbinwidth, no_xbins)
+    xbinwidth = (xmax - xmin) / no_xbins
+    xbins = np.linspace(xmin, xmax + xbinwidth, no_xbins)
 
     nanaxx.hist(nanxdata, bins=xbins, **kwargs)
     nanaxx.scatter(
@@ -2,27 +2,13 @@
 Transformation utilites for matplotlib.
 """
 import numpy as np
-from ...comp.codata import close
 from ..log import Handle
 
 logger = Handle(__name__)
 
-
-def affine_transform(mtx=np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])):
-    """
-    Construct a function which will perform a 2D affine transform based on
-    a 3x3 affine matrix.
-
-    Parameters
-    -----------
-    mtx : :class:`numpy.ndarray`
-    """
-
-    def tfm(data):
-        xy = data[:, :2]
-        return (mtx @ np.vstack((xy.T[:2], np.ones(xy.T.shape[1]))))[:2]
-
-    return tfm
+# shear matrices between ternary (A, B) and cartesian (x, y) coordinates
+_SHEAR_FWD = np.array([[1, 1 / 2], [0, 1]])
+_SHEAR_INV = np.array([[1, -1 / 2], [0, 1]])
 
 
 def ABC_to_xy(ABC, xscale=1.0, yscale=1.0):
@@ -45,11 +31,10 @@ def ABC_to_xy(ABC, xscale=1.0, yscale=1.0):
         Array of x-y coordinates (:code:`samples, 2`)
     """
     assert ABC.shape[-1] == 3
-    # transform from ternary to xy cartesian
-    scale = affine_transform(np.array([[xscale, 0, 0], [0, yscale, 0], [0, 0, 1]]))
-    shear = affine_transform(np.array([[1, 1 / 2, 0], [0, 1, 0], [0, 0, 1]]))
-    xy = scale(shear(close(ABC)).T)
-    return xy.T
+    # transform from ternary to xy cartesian; shear then scale
+    xy = ABC[:, :2] @ (_SHEAR_FWD.T * np.array([xscale, yscale]))
+    # closure commutes with the linear transform, so normalise the 2D output
+    return xy / ABC.sum(axis=1)[:, np.newaxis]
 
 
 def xy_to_ABC(xy, xscale=1.0, yscale=1.0):
@@ -71,11 +56,7 @@ def xy_to_ABC(xy, xscale=1.0, yscale=1.0):
         Array of ternary coordinates (:code:`samples, 3`)
     """
     assert xy.shape[-1] == 2
-    # transform from xy cartesian to ternary
-    scale = affine_transform(
-        np.array([[1 / xscale, 0, 0], [0, 1 / yscale, 0], [0, 0, 1]])
-    )
-    shear = affine_transform(np.array([[1, -1 / 2, 0], [0, 1, 0], [0, 0, 1]]))
-    A, B = shear(scale(xy).T)
-    C = 1.0 - (A + B)  # + (xscale-1) + (yscale-1)
-    return np.vstack([A, B, C]).T
+    # transform from xy cartesian to ternary; unscale then unshear
+    AB = (xy[:, :2] / np.array([xscale, yscale])) @ _SHEAR_INV.T
+    C = 1.0 - AB.sum(axis=1)  # + (xscale-1) + (yscale-1)
+    return np.column_stack([AB, C])
@@ -135,11 +135,34 @@ class TestTernaryHeatmap(unittest.TestCase):
         coords, H, data = out
         self.assertTrue(coords[0].shape == coords[1].shape)
 
+    def test_histogram_orientation(self):
+        # hand-counted clusters at asymmetric positions in the transformed space
+        clusters = [([0.6, 0.3, 0.1], 5), ([0.1, 0.3, 0.6], 2), ([0.2, 0.5, 0.3], 1)]
+        arr = np.vstack([np.tile(c, (n, 1)) for c, n in clusters])
+        coords, H, data = ternary_heatmap(arr, mode="histogram")
+        self.assertEqual(H.sum(), arr.shape[0])
+        xc, yc = data["tfm_centres"][0][0, :], data["tfm_centres"][1][:, 0]
+        for c, n in clusters:
+            tx, ty = data["grid_transform"](np.array([c]))[0]
+            ix, iy = np.argmin(np.abs(xc - tx)), np.argmin(np.abs(yc - ty))
+            self.assertEqual(H[iy, ix], n)  # rows correspond to the second axis
+
     def test_density(self):
         out = ternary_heatmap(self.data, mode="density")
         coords, H, data = out
         self.assertTrue(coords[0].shape == coords[1].shape)
 
+    def test_density_fft(self):
+        coords, H, data = ternary_heatmap(self.data, mode="density", fft=True)
+        _, expect, _ = ternary_heatmap(self.data, mode="density")
+        self.assertTrue(H.shape == expect.shape)
+        self.assertTrue(np.abs(H - expect).max() < 0.2 * expect.max())
+
+    def test_density_fft_with_grid(self):
+        grid = np.random.randn(10, 2)
+        with self.assertRaises(ValueError):
+            ternary_heatmap(self.data, mode="density", fft=True, grid=grid)
+
     def test_transform(self):
         for tfm, itfm in [
             (ALR, inverse_ALR),
@@ -28,17 +28,29 @@ class TestPercentileContourValuesFromMeshZ(unittest.TestCase):
                 pc, cs = percentile_contour_values_from_meshz(self.z, percentiles=ps)
 
     def test_resolution(self):
-        for res in [10, 100, 1000, 10000]:
+        for res in [10, 100, 10000]:
             with self.subTest(res=res):
-                pc, cs = percentile_contour_values_from_meshz(self.z, resolution=res)
+                with self.assertWarns(DeprecationWarning):
+                    pc, cs = percentile_contour_values_from_meshz(
+                        self.z, resolution=res
+                    )
+
+    def test_threshold_integral_parity(self):
+        # compare to integrating Z above a fine sweep of thresholds
+        ps = [0.95, 0.66, 0.33]
+        t = np.linspace(0.0, self.z.max(), 1000)
+        integral = np.array([self.z[self.z >= _t].sum() for _t in t])
+        expect = np.interp(np.array(ps) * self.z.sum(), integral[::-1], t[::-1])
+        pc, cs = percentile_contour_values_from_meshz(self.z, percentiles=ps)
+        self.assertTrue(np.allclose(cs, expect, rtol=0.01))
 
     def test_ask_below_minimum(self):
         for ps in [[0.0001], [0.000001]]:
             with self.subTest(ps=ps):
-                pc, cs = percentile_contour_values_from_meshz(
-                    self.z, percentiles=ps, resolution=5
-                )
+                pc, cs = percentile_contour_values_from_meshz(self.z, percentiles=ps)
                 self.assertIn("min", pc)
+                # threshold at the low end of the distribution
+                self.assertTrue(np.allclose(cs, [self.z.min()]))
 
 
 class TestPlotZPercentiles(unittest.TestCase):
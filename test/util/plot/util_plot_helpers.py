@@ -88,6 +88,23 @@ class TestPlotStDevEllipses(unittest.TestCase):
 
                 plot_stdev_ellipses(comp, transform=transform)
 
+    def test_ellipse_mahalanobis_distance(self):
+        # correlated data, such that the ellipses are rotated off the axes
+        comp = np.random.multivariate_normal(
+            [1.0, -0.5], [[2.0, 1.2], [1.2, 1.0]], size=500
+        )
+        mu, C = np.nanmean(comp, axis=0), np.cov(comp, rowvar=False)
+        nstds = 3
+        ax = plot_stdev_ellipses(comp, nstds=nstds)
+        patches = ax.patches or ax.artists
+        self.assertEqual(len(patches), nstds)
+        # ellipses are added from the outermost inwards
+        for patch, nstd in zip(patches, np.arange(1, nstds + 1)[::-1]):
+            with self.subTest(nstd=nstd):
+                d = patch.get_path().vertices - mu
+                dist = np.sqrt(np.sum((d @ np.linalg.inv(C)) * d, axis=1))
+                self.assertTrue(np.allclose(dist, nstd))
+
     def tearDown(self):
         plt.close("all")
 
@@ -1,5 +1,40 @@
 import unittest
-from pyrolite.util.distributions import lognorm_to_norm, norm_to_lognorm
+import numpy as np
+from pyrolite.util.distributions import (
+    sample_kde,
+    sample_kde_fft,
+    lognorm_to_norm,
+    norm_to_lognorm,
+)
+
+
+class TestSampleKDEFFT(unittest.TestCase):
+    def setUp(self):
+        self.data = np.random.multivariate_normal([0, 0], [[1, 0.5], [0.5, 2]], 500)
+        self.samples = np.meshgrid(np.linspace(-6, 6, 101), np.linspace(-8, 8, 121))
+
+    def test_default(self):
+        zi = sample_kde_fft(self.data, self.samples)
+        self.assertEqual(zi.shape, self.samples[0].shape)
+
+    def test_not_bivariate(self):
+        # a single row is transposed to a column (as for sample_kde), i.e. univariate
+        for data in [np.random.randn(200), np.random.randn(200, 3)]:
+            with self.subTest(shape=data.shape):
+                with self.assertRaises(ValueError):
+                    sample_kde_fft(data, self.samples)
+
+    def test_grid_too_small(self):
+        for nx, ny in [(1, 10), (10, 1)]:
+            with self.subTest(nx=nx, ny=ny):
+                samples = np.meshgrid(np.linspace(-6, 6, nx), np.linspace(-8, 8, ny))
+                with self.assertRaises(ValueError):
+                    sample_kde_fft(self.data, samples)
+
+    def test_approximates_kde(self):
+        expect = sample_kde(self.data, self.samples)
+        zi = sample_kde_fft(self.data, self.samples)
+        self.assertTrue(np.abs(zi - expect).max() < 0.02 * expect.max())
 
 
 class TestLognorm2Norm(unittest.TestCase):
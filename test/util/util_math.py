@@ -76,6 +76,17 @@ class TestGridFromRanges(unittest.TestCase):
             out = grid_from_ranges(self.x, bins=bins)
 
 
+class TestFlattenGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = np.meshgrid(np.linspace(0, 1, 4), np.linspace(2, 3, 3))
+
+    def test_default(self):
+        out = flattengrid(self.grid)
+        self.assertEqual(out.shape, (12, 2))
+        self.assertTrue(np.allclose(out[:, 0], self.grid[0].flatten()))
+        self.assertTrue(np.allclose(out[:, 1], self.grid[1].flatten()))
+
+
 class TestIsClose(unittest.TestCase):
     def test_non_nan(self):
         self.assertTrue(isclose(1.0, 1.0))